@@ -1,15 +1,97 @@
 from dataclasses import dataclass, field
-from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+# Month names for date formatting; a tuple index is far cheaper than
+# building a datetime just to strftime it, and avoids locale lookups.
+_MONTHS = (
+    "January",
+    "February",
+    "March",
+    "April",
+    "May",
+    "June",
+    "July",
+    "August",
+    "September",
+    "October",
+    "November",
+    "December",
+)
+
+# Formatted dates keyed by (date, further_id); shows are rendered more than
+# once (header + continued pages), so repeated lookups skip strftime entirely.
+_FMT_CACHE: dict[tuple[str, str], str] = {}
+
+# A page comfortably fits this many song lines before we spill over
+PAGE_SONG_CAP = 20
+
+# Page-split boundaries keyed by the tuple of set sizes; many shows share the
+# same shape, so the partition DP only runs once per distinct shape.
+_PARTITION_CACHE: dict[tuple[int, ...], list[tuple[int, int]]] = {}
+
+
+def _partition_boundaries(sizes: tuple[int, ...], num_pages: int) -> list[tuple[int, int]]:
+    """
+    Split a sequence of set sizes into num_pages contiguous runs, with no
+    page over PAGE_SONG_CAP songs (a run of a single oversized set is always
+    allowed since it can't be split further).
+
+    Knuth/Plass-style badness: each page costs the squared deviation of its
+    song count from the even-split target, so the DP prefers balanced
+    spreads over merely bounding the largest page — a lopsided 19/3 split
+    now loses to 11/11 instead of tying other cap-respecting splits.
+
+    Returns (start, end) index pairs into the original sequence.
+    """
+    cached = _PARTITION_CACHE.get(sizes)
+    if cached is not None:
+        return cached
+
+    n = len(sizes)
+    prefix = [0] * (n + 1)
+    for i, size in enumerate(sizes):
+        prefix[i + 1] = prefix[i] + size
+
+    target = prefix[n] / num_pages
+
+    def fits(j: int, i: int) -> bool:
+        return prefix[i] - prefix[j] <= PAGE_SONG_CAP or i - j == 1
+
+    inf = float("inf")
+    # dp[k][i]: minimal total badness splitting the first i sets into k pages
+    dp = [[inf] * (n + 1) for _ in range(num_pages + 1)]
+    parent = [[0] * (n + 1) for _ in range(num_pages + 1)]
+    dp[0][0] = 0
+
+    for k in range(1, num_pages + 1):
+        for i in range(k, n + 1):
+            for j in range(k - 1, i):
+                if dp[k - 1][j] == inf or not fits(j, i):
+                    continue
+                cost = dp[k - 1][j] + (prefix[i] - prefix[j] - target) ** 2
+                if cost < dp[k][i]:
+                    dp[k][i] = cost
+                    parent[k][i] = j
+
+    boundaries = []
+    i = n
+    for k in range(num_pages, 0, -1):
+        j = parent[k][i]
+        boundaries.append((j, i))
+        i = j
+    boundaries.reverse()
+
+    _PARTITION_CACHE[sizes] = boundaries
+    return boundaries
+
 
 class LayoutType(Enum):
     SINGLE = "single"
     SPREAD = "spread"
 
 
-@dataclass
+@dataclass(slots=True)
 class Set:
     label: str = ""
     annotation: Optional[str] = None
@@ -25,7 +107,9 @@ class Set:
         return len(self.songs)
 
 
-@dataclass
+# slots=True drops the per-instance __dict__: thousands of Show/Set objects
+# get smaller and attribute access takes the slot-descriptor fast path
+@dataclass(slots=True)
 class Show:
     date: str = ""
     further_id: str = ""
@@ -35,34 +119,64 @@ class Show:
     state_or_country: str = ""
     notes: Optional[str] = None
     sets: list = field(default_factory=list)
+    _groupings: Optional[list] = field(default=None, init=False, repr=False)
+    _ymd: Optional[tuple[int, ...]] = field(default=None, init=False, repr=False)
+    _total_songs: Optional[int] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self):
+        if self.date:
+            self._parse_date()
+
+    def _parse_date(self) -> None:
+        self._ymd = tuple(int(p) for p in self.date.split("/"))
+
+    @property
+    def ymd(self) -> tuple[int, ...]:
+        """(year, month, day) parsed once from the date string.
+
+        Tuples compare lexicographically, so date-range checks need no
+        datetime construction. The lazy fallback covers Shows built with a
+        date assigned after construction.
+        """
+        if self._ymd is None:
+            self._parse_date()
+        return self._ymd
 
     @property
     def year(self) -> int:
-        return int(self.date.split("/")[0])
+        return self.ymd[0]
 
     @property
     def month(self) -> int:
-        return int(self.date.split("/")[1])
+        return self.ymd[1]
 
     @property
     def day(self) -> int:
-        return int(self.date.split("/")[2])
+        return self.ymd[2]
 
     @property
     def formatted_date(self) -> str:
         """Convert YYYY/MM/DD to a readable format"""
-        parts = self.date.split("/")
+        key = (self.date, self.further_id or "")
+        date = _FMT_CACHE.get(key)
+        if date is not None:
+            return date
+
+        parts = self.ymd
         if len(parts) == 3:
-            date = datetime(int(parts[0]), int(parts[1]), int(parts[2])).strftime(
-                "%B %d, %Y"
-            )
+            y, m, d = parts
+            # Day stays zero-padded to match the old strftime("%B %d, %Y")
+            date = f"{_MONTHS[m - 1]} {d:02d}, {y}"
         else:
             date = self.date
 
         if self.further_id:
             date += f" {self.further_id}"
+        _FMT_CACHE[key] = date
         return date
 
+    # Plain properties: cached_property needs a per-instance __dict__, which
+    # slots removes, and these are single f-strings anyway
     @property
     def venue_display(self) -> str:
         if self.venue2:
@@ -74,57 +188,43 @@ class Show:
         return f"{self.city}, {self.state_or_country}"
 
     def __len__(self) -> int:
-        return sum(len(s) for s in self.sets)
+        # Cached after the show is fully assembled; sets aren't mutated
+        # once parsing has moved on to the next show
+        if self._total_songs is None:
+            self._total_songs = sum(len(s) for s in self.sets)
+        return self._total_songs
 
     def to_page_friendly_set_groupings(self) -> list[list[Set]]:
+        # Computed once per show: classify_layout, the renderer, and the page
+        # accounting in generate_book all ask for the same groupings.
+        if self._groupings is not None:
+            return self._groupings
+
+        # Common case: under the cap the page counter below can never fire,
+        # so the whole show fits on one page
+        if len(self) < PAGE_SONG_CAP:
+            self._groupings = [self.sets]
+            return self._groupings
+
+        sizes = tuple(len(s) for s in self.sets)
+
         num_pages = 1
         curr_lines = 0
-        for s in self.sets:
-            if curr_lines + len(s) >= 20:
+        for size in sizes:
+            if curr_lines + size >= PAGE_SONG_CAP:
                 num_pages += 1
-                curr_lines = len(s)
+                curr_lines = size
             else:
-                curr_lines += len(s)
+                curr_lines += size
 
         if num_pages == 1:
-            return [self.sets]
-
-        # try to divide as evenly as possible
-        num_songs = sum(len(s) for s in self.sets)
-        songs_per_page = (num_songs + 1) // num_pages
-
-        ret = []
-        curr_songs = 0
-        next = 0
-
-        for curr_page in range(1, num_pages + 1):
-            if next >= len(self.sets):
-                break
-
-            ret.append([self.sets[next]])
-            curr_songs += len(self.sets[next])
-
-            next += 1
-
-            while (songs_per_page * curr_page) > curr_songs + 5:
-                if next >= len(self.sets):
-                    break
-
-                # eek!
-                if sum(len(s) for s in ret[-1]) + len(self.sets[next]) > 20:
-                    break
-
-                ret[-1].append(self.sets[next])
-                curr_songs += len(self.sets[next])
-                next += 1
-
-        while next < len(self.sets):
-            if len(ret) < num_pages:
-                ret.append([])
-            ret[-1].append(self.sets[next])
-            next += 1
-
-        return ret
+            self._groupings = [self.sets]
+        else:
+            # divide as evenly as possible
+            num_pages = min(num_pages, len(sizes))
+            boundaries = _partition_boundaries(sizes, num_pages)
+            self._groupings = [self.sets[start:end] for start, end in boundaries]
+        return self._groupings
 
     def classify_layout(self) -> LayoutType:
         groupings = self.to_page_friendly_set_groupings()
@@ -14,86 +14,150 @@ Usage:
 """
 
 import argparse
-from datetime import datetime
+import bisect
+import concurrent.futures
+import functools
+import os
 from pathlib import Path
 from typing import Optional
 
 from classes import LayoutType, Set, Show
-from parse_shows import get_all_shows
+from parse_shows import get_all_shows, load_or_build_snapshot
 from weasyprint import HTML
 from weasyprint.text.fonts import FontConfiguration
 
 
-def format_song(song: str) -> tuple[str, bool]:
+# Single C-level pass per field; cheaper than html.escape's chained
+# str.replace calls and applied to every data-derived string we interpolate
+_HTML_ESCAPE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"}
+)
+
+
+def _e(s: str) -> str:
+    """Escape HTML-unsafe characters in one translate pass"""
+    return s.translate(_HTML_ESCAPE)
+
+
+# Rendering templates, hoisted to module scope so each renderer fills a
+# single format string instead of appending line-by-line and joining.
+_SET_TPL = """    <section class="set">
+{label_html}      <ul class="songs">
+{songs_html}
+      </ul>
+    </section>"""
+
+_SET_LABEL_TPL = """      <h3 class="set-label">{label}{annotation_html}</h3>
+"""
+
+_SET_ANNOTATION_TPL = ' <span class="set-annotation">({annotation})</span>'
+
+# Song lines are by far the hottest template, so they're assembled with a
+# plain str.join over constant pieces rather than the format machinery
+_LI_OPEN = "        <li"
+_LI_CLOSE = "</li>"
+_NOTE_OPEN = ' <span class="song-note">'
+_NOTE_CLOSE = "</span></li>"
+
+_SEGUE_CLASS = ("", ' class="segue"')
+
+_HEADER_TPL = """  <header class="show-header">
+    <h2 class="show-date">{date}</h2>
+    <p class="show-venue">{venue}</p>
+    <p class="show-location">{location}</p>
+{notes_html}  </header>"""
+
+_NOTES_TPL = """    <p class="show-notes">{notes}</p>
+"""
+
+_CONT_HEADER_TPL = """  <header class="show-header show-header-continued">
+    <p class="show-date-continued">{date} <span class="continued-label">(continued)</span></p>
+  </header>"""
+
+_SHOW_TPL = """<article class="{css_class}">
+{header_html}
+  <div class="sets">
+{sets_html}
+  </div>
+</article>"""
+
+
+@functools.lru_cache(maxsize=None)
+def format_song(song: str) -> tuple[str, bool, Optional[str]]:
     """
     Parse a song entry, returning (song_name, is_segue, note)
     Songs starting with '>' indicate segue from previous
     Songs with '*' or other annotations at the end have notes
     """
+    song = song.strip()
     is_segue = song.startswith(">")
     if is_segue:
-        song = song[1:].strip()
+        song = song[1:].lstrip()
+    song = _e(song)
 
-    return song.strip(), is_segue
+    # Fast path: the overwhelming majority of songs carry no annotation,
+    # so a single find covers them without any pattern matching
+    star_idx = song.find("*")
+    if star_idx == -1:
+        return song, is_segue, None
+
+    return song[:star_idx].rstrip(), is_segue, song[star_idx:]
 
 
 def render_set_html(s: Set, is_only_set: bool) -> str:
     """Render a single set as HTML"""
-    lines = []
-    lines.append('    <section class="set">')
-
+    label_html = ""
     if not is_only_set:
-        label_html = f'<h3 class="set-label">{s.display_label}'
-        if s.annotation:
-            label_html += f' <span class="set-annotation">({s.annotation})</span>'
-        label_html += "</h3>"
-        lines.append(f"      {label_html}")
-
-    lines.append('      <ul class="songs">')
-    for song in s.songs:
-        song_name, is_segue = format_song(song)
-        class_attr = ' class="segue"' if is_segue else ""
-        lines.append(f"        <li{class_attr}>{song_name}</li>")
-    lines.append("      </ul>")
-    lines.append("    </section>")
+        annotation_html = (
+            _SET_ANNOTATION_TPL.format(annotation=_e(s.annotation))
+            if s.annotation
+            else ""
+        )
+        label_html = _SET_LABEL_TPL.format(
+            label=_e(s.display_label), annotation_html=annotation_html
+        )
 
-    return "\n".join(lines)
+    songs_html = "\n".join(
+        "".join((_LI_OPEN, _SEGUE_CLASS[is_segue], ">", song_name, _LI_CLOSE))
+        if note is None
+        else "".join(
+            (_LI_OPEN, _SEGUE_CLASS[is_segue], ">", song_name, _NOTE_OPEN, note, _NOTE_CLOSE)
+        )
+        for song_name, is_segue, note in map(format_song, s.songs)
+    )
+    return _SET_TPL.format(label_html=label_html, songs_html=songs_html)
 
 
 def render_show_header_html(show: Show) -> str:
     """Render just the show header (date, venue, notes)"""
-    lines = []
-    lines.append('  <header class="show-header">')
-    lines.append(f'    <h2 class="show-date">{show.formatted_date}</h2>')
-    lines.append(f'    <p class="show-venue">{show.venue_display}</p>')
-    lines.append(f'    <p class="show-location">{show.location_display}</p>')
-
+    notes_html = ""
     if show.notes:
         notes = show.notes.strip()
         if notes.startswith("(") and notes.endswith(")"):
             notes = notes[1:-1]
-        lines.append(f'    <p class="show-notes">{notes}</p>')
+        notes_html = _NOTES_TPL.format(notes=_e(notes))
 
-    lines.append("  </header>")
-    return "\n".join(lines)
+    return _HEADER_TPL.format(
+        date=_e(show.formatted_date),
+        venue=_e(show.venue_display),
+        location=_e(show.location_display),
+        notes_html=notes_html,
+    )
 
 
-def render_show_single(show: Show) -> str:
+def render_show_single(show: Show, out) -> None:
     """Render a show that fits on a single page"""
-    css_class = "show"
-
-    lines = [f'<article class="{css_class}">']
-    lines.append(render_show_header_html(show))
-    lines.append('  <div class="sets">')
-    for s in show.sets:
-        lines.append(render_set_html(s, len(show.sets) == 1))
-    lines.append("  </div>")
-    lines.append("</article>")
-
-    return "\n".join(lines)
+    is_only_set = len(show.sets) == 1
+    out.write(
+        _SHOW_TPL.format(
+            css_class="show",
+            header_html=render_show_header_html(show),
+            sets_html="\n".join(render_set_html(s, is_only_set) for s in show.sets),
+        )
+    )
 
 
-def render_show_spread(show: Show) -> str:
+def render_show_spread(show: Show, sets: list[list[Set]], out) -> None:
     """
     Render a show as a two-page spread.
 
@@ -103,54 +167,41 @@ def render_show_spread(show: Show) -> str:
 
     Uses CSS to force page 1 to start on a left page.
     """
-    sets = show.to_page_friendly_set_groupings()
     sets_page1, *remaining_sets = sets
 
-    lines = []
-
     # Page 1: Verso (left page) - starts on left via CSS
-    lines.append('<article class="show show-spread">')
-    lines.append(render_show_header_html(show))
-    lines.append('  <div class="sets">')
-    for s in sets_page1:
-        lines.append(render_set_html(s, False))
-    lines.append("  </div>")
-    lines.append("</article>")
+    out.write(
+        _SHOW_TPL.format(
+            css_class="show show-spread",
+            header_html=render_show_header_html(show),
+            sets_html="\n".join(render_set_html(s, False) for s in sets_page1),
+        )
+    )
 
     for set_page in remaining_sets:
-        # Page 2: Recto (right page)
-        # and further pages as needed
-        lines.append('<article class="show show-spread">')
-        # Condensed header for continuity
-        lines.append('  <header class="show-header show-header-continued">')
-        lines.append(
-            f'    <p class="show-date-continued">{show.formatted_date} <span class="continued-label">(continued)</span></p>'
+        # Page 2: Recto (right page), and further pages as needed,
+        # with a condensed header for continuity
+        out.write("\n")
+        out.write(
+            _SHOW_TPL.format(
+                css_class="show show-spread",
+                header_html=_CONT_HEADER_TPL.format(date=_e(show.formatted_date)),
+                sets_html="\n".join(render_set_html(s, False) for s in set_page),
+            )
         )
-        lines.append("  </header>")
-        lines.append('  <div class="sets">')
-        for s in set_page:
-            lines.append(render_set_html(s, False))
-        lines.append("  </div>")
-        lines.append("</article>")
-
-    return "\n".join(lines)
 
 
-def render_show_html(show: Show) -> str:
+def render_show_html(show: Show, out) -> None:
     """Render a show with appropriate layout based on its size"""
-    layout_type = show.classify_layout()
+    groupings = show.to_page_friendly_set_groupings()
 
-    if layout_type == LayoutType.SPREAD:
-        return render_show_spread(show)
+    if len(groupings) > 1:
+        render_show_spread(show, groupings, out)
     else:
-        return render_show_single(show)
+        render_show_single(show, out)
 
 
-def render_volume_title(
-    title: str, subtitle: str, year_range: str, show_count: int
-) -> str:
-    """Render a volume title page"""
-    return f"""
+_VOLUME_TITLE_TPL = """
 <div class="volume-title-page">
   <h1>{title}</h1>
   <p class="subtitle">{subtitle}</p>
@@ -161,50 +212,84 @@ def render_volume_title(
 """
 
 
-def render_blank_page() -> str:
+def render_volume_title(
+    title: str, subtitle: str, year_range: str, show_count: int, out
+) -> None:
+    """Render a volume title page"""
+    out.write(
+        _VOLUME_TITLE_TPL.format(
+            title=_e(title),
+            subtitle=_e(subtitle),
+            year_range=_e(year_range),
+            show_count=show_count,
+        )
+    )
+
+
+_BLANK_PAGE = '<article class="show"><div class="blank-page"></div></article>'
+
+
+def render_blank_page(out) -> None:
     """Render a blank page to adjust pagination"""
-    return '<article class="show"><div class="blank-page"></div></article>'
+    out.write(_BLANK_PAGE)
 
 
-def render_html_document(content: str, title: str = "Grateful Dead Setlists") -> str:
-    """Wrap content in a full HTML document"""
-    return f"""<!DOCTYPE html>
+# Document skeleton, split around the shows so they can be streamed to the
+# output file one at a time instead of joined into one giant string. The
+# head is further split around the title so the constant pieces are written
+# as-is with no format-string interpolation.
+_HTML_HEAD_PRE_TITLE = """<!DOCTYPE html>
 <html lang="en">
 <head>
   <meta charset="UTF-8">
   <meta name="viewport" content="width=device-width, initial-scale=1.0">
-  <title>{title}</title>
+  <title>"""
+
+_HTML_HEAD_POST_TITLE = """</title>
   <link rel="preconnect" href="https://fonts.googleapis.com">
   <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
   <link href="https://fonts.googleapis.com/css2?family=Crimson+Text:ital,wght@0,400;0,600;1,400&family=EB+Garamond:ital,wght@0,400;0,600;1,400&family=Playfair+Display:wght@400;700&family=Source+Sans+Pro:wght@400;600&display=swap" rel="stylesheet">
   <link rel="stylesheet" href="../templates/style.css">
 </head>
 <body>
-{content}
-</body>
+"""
+
+_HTML_TAIL = """</body>
 </html>
 """
 
 
-def get_era_dates(era: str) -> tuple[int, int, int, int, int, int, str]:
-    """Return start and end dates for an era"""
-    eras = {
-        "1": (1966, 1, 8, 1969, 7, 12, "The Bus Came by and I Got On"),
-        "2": (1969, 8, 2, 1971, 2, 18, "Down on Bourbon Street"),
-        "3": (1971, 2, 19, 1972, 8, 27, "I'll Walk You in the Sunshine"),
-        "4": (1972, 9, 3, 1974, 10, 20, "Just Songs of Our Own"),
-        "5": (1975, 3, 23, 1978, 7, 8, "The Compass Always Points to Terrapin"),
-        "6": (1978, 8, 30, 1980, 7, 1, "When I Awoke the Stars Were Out and Shining"),
-        "7": (1980, 8, 16, 1981, 12, 31, "Let There be Songs to Fill the Air"),
-        "8": (1982, 2, 16, 1984, 5, 8, "Wheel to the Storm and Fly"),
-        "9": (1984, 6, 9, 1986, 7, 7, "And Love Will See You Through"),
-        "10": (1986, 12, 15, 1988, 7, 31, "We Will Get By / We Will Survive"),
-        "11": (1988, 8, 26, 1990, 7, 23, "A Lovely View of Heaven"),
-        "12": (1990, 9, 7, 1992, 3, 24, "Long Way to Go Home"),
-        "13": (1992, 5, 19, 1993, 12, 19, "So Many Roads to Ease My Soul"),
-        "14": (1994, 2, 25, 1995, 7, 9, "I Sang Love's Sweet Song"),
-    }
-    return eras.get(era, (1966, 1, 8, 1995, 7, 9, "Complete"))
+_ERA_DATES = {
+    "1": (1966, 1, 8, 1969, 7, 12, "The Bus Came by and I Got On"),
+    "2": (1969, 8, 2, 1971, 2, 18, "Down on Bourbon Street"),
+    "3": (1971, 2, 19, 1972, 8, 27, "I'll Walk You in the Sunshine"),
+    "4": (1972, 9, 3, 1974, 10, 20, "Just Songs of Our Own"),
+    "5": (1975, 3, 23, 1978, 7, 8, "The Compass Always Points to Terrapin"),
+    "6": (1978, 8, 30, 1980, 7, 1, "When I Awoke the Stars Were Out and Shining"),
+    "7": (1980, 8, 16, 1981, 12, 31, "Let There be Songs to Fill the Air"),
+    "8": (1982, 2, 16, 1984, 5, 8, "Wheel to the Storm and Fly"),
+    "9": (1984, 6, 9, 1986, 7, 7, "And Love Will See You Through"),
+    "10": (1986, 12, 15, 1988, 7, 31, "We Will Get By / We Will Survive"),
+    "11": (1988, 8, 26, 1990, 7, 23, "A Lovely View of Heaven"),
+    "12": (1990, 9, 7, 1992, 3, 24, "Long Way to Go Home"),
+    "13": (1992, 5, 19, 1993, 12, 19, "So Many Roads to Ease My Soul"),
+    "14": (1994, 2, 25, 1995, 7, 9, "I Sang Love's Sweet Song"),
+    None: (1966, 1, 8, 1995, 7, 9, "Complete"),
+}
+
+# Era records precomputed once at import: boundary ymd tuples for direct
+# comparison against Show.ymd, plus the nickname and the year-range string.
+_ERA_TABLE = {
+    era: ((sy, sm, sd), (ey, em, ed), nickname, f"{sm}/{sd}/{sy}–{em}/{ed}/{ey}")
+    for era, (sy, sm, sd, ey, em, ed, nickname) in _ERA_DATES.items()
+}
+
+
+def get_era_dates(
+    era: str,
+) -> tuple[tuple[int, int, int], tuple[int, int, int], str, str]:
+    """Return the (start_ymd, end_ymd, nickname, year_range) record for an era"""
+    return _ERA_TABLE.get(era, _ERA_TABLE[None])
 
 
 def generate_book(
@@ -213,50 +298,41 @@ def generate_book(
     era: Optional[str] = None,
     debug_layout: bool = False,
 ) -> None:
-    """Generate an HTML book from shows"""
+    """Generate an HTML book from shows, filtering to the era if given"""
+    if era:
+        # Tuple comparison against the pre-parsed (y, m, d) avoids building
+        # two datetime objects per show
+        start_tup, end_tup, _, _ = get_era_dates(era)
+        shows = [s for s in shows if start_tup <= s.ymd <= end_tup]
+
+    generate_book_prefiltered(shows, output_path, era=era, debug_layout=debug_layout)
+
+
+def generate_book_prefiltered(
+    shows: list[Show],
+    output_path: Path,
+    era: Optional[str] = None,
+    debug_layout: bool = False,
+) -> None:
+    """Generate an HTML book from shows already restricted to the era"""
 
     nickname = None
-    # Filter shows
     if era:
-        start_year, start_month, start_day, end_year, end_month, end_day, nickname = (
-            get_era_dates(era)
-        )
-        start_date = datetime(start_year, start_month, start_day)
-        end_date = datetime(end_year, end_month, end_day)
-
-        era_shows = []
-        for s in shows:
-            show_date = datetime(s.year, s.month, s.day)
-            if start_date <= show_date <= end_date:
-                era_shows.append(s)
-        shows = era_shows
+        _, _, nickname, year_range = get_era_dates(era)
         title = f"Grateful Dead: {nickname}"
-        year_range = (
-            f"{start_month}/{start_day}/{start_year}–{end_month}/{end_day}/{end_year}"
-        )
     else:
         title = "Grateful Dead: Complete Setlists"
-        years = sorted(set(s.year for s in shows))
+        # Only the endpoints matter; no need to build and sort a year set
+        years = [s.year for s in shows]
         year_range = f"{min(years)}–{max(years)}" if years else ""
 
     if not shows:
         print("No shows found for the specified filter")
         return
 
-    # Layout statistics
+    # Layout statistics, tallied during the render loop rather than in a
+    # separate pass over the shows
     layout_counts = {LayoutType.SINGLE: 0, LayoutType.SPREAD: 0}
-    for show in shows:
-        layout_counts[show.classify_layout()] += 1
-
-    if debug_layout:
-        print("\nLayout breakdown:")
-        print(f"  Single page: {layout_counts[LayoutType.SINGLE]}")
-        print(f"  Spread:      {layout_counts[LayoutType.SPREAD]}")
-
-    # Build content with page tracking
-    content_parts = []
-    current_page = 1  # Start on page 1 (recto/right)
-    blank_pages_inserted = 0
 
     volume_title = title
     if nickname is not None:
@@ -266,42 +342,61 @@ def generate_book(
     if era:
         volume_subtitle = f"Grateful Dead: Complete Setlists #{era}"
 
-    # Volume title page takes 1 page
-    content_parts.append(
-        render_volume_title(volume_title, volume_subtitle, year_range, len(shows))
-    )
-    # couple of blank pages for spacing
-    content_parts.append(render_blank_page())
-    content_parts.append(render_blank_page())
-    current_page += 3  # Now on page 4 (recto/right)
-
-    for show in shows:
-        layout_type = show.classify_layout()
-
-        # For spreads, ensure we start on a verso (left/even) page
-        if layout_type == LayoutType.SPREAD:
-            # If current page is odd (recto/right), insert blank page
-            if current_page % 2 == 1:
-                content_parts.append(render_blank_page())
-                current_page += 1
-                blank_pages_inserted += 1
-
-            # Spread shows take multiple pages
-            sets_groupings = show.to_page_friendly_set_groupings()
-            pages_needed = len(sets_groupings)
-            content_parts.append(render_show_html(show))
-            current_page += pages_needed
-        else:
-            # Single page shows
-            content_parts.append(render_show_html(show))
-            current_page += 1
-
-    # Generate final HTML
-    html = render_html_document("\n".join(content_parts), title=title)
-
-    # Write output
+    # Stream content to the file with page tracking; peak memory stays at
+    # one rendered show instead of the whole book.
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(html)
+    with output_path.open("w", encoding="utf-8", buffering=1 << 20) as out:
+        out.write(_HTML_HEAD_PRE_TITLE)
+        out.write(_e(title))
+        out.write(_HTML_HEAD_POST_TITLE)
+
+        current_page = 1  # Start on page 1 (recto/right)
+        blank_pages_inserted = 0
+
+        # Volume title page takes 1 page
+        render_volume_title(volume_title, volume_subtitle, year_range, len(shows), out)
+        out.write("\n")
+        # couple of blank pages for spacing
+        render_blank_page(out)
+        out.write("\n")
+        render_blank_page(out)
+        out.write("\n")
+        current_page += 3  # Now on page 4 (recto/right)
+
+        for show in shows:
+            # One derivation per show: the groupings determine the layout,
+            # the page count, and what gets rendered
+            groupings = show.to_page_friendly_set_groupings()
+
+            if len(groupings) > 1:
+                layout_counts[LayoutType.SPREAD] += 1
+
+                # For spreads, ensure we start on a verso (left/even) page;
+                # if current page is odd (recto/right), insert blank page
+                if current_page % 2 == 1:
+                    render_blank_page(out)
+                    out.write("\n")
+                    current_page += 1
+                    blank_pages_inserted += 1
+
+                # Spread shows take one page per grouping
+                render_show_spread(show, groupings, out)
+                out.write("\n")
+                current_page += len(groupings)
+            else:
+                # Single page shows
+                layout_counts[LayoutType.SINGLE] += 1
+                render_show_single(show, out)
+                out.write("\n")
+                current_page += 1
+
+        out.write(_HTML_TAIL)
+
+    if debug_layout:
+        print("\nLayout breakdown:")
+        print(f"  Single page: {layout_counts[LayoutType.SINGLE]}")
+        print(f"  Spread:      {layout_counts[LayoutType.SPREAD]}")
+
     print(f"Generated: {output_path}")
     print(
         f"  Shows: {len(shows)} (single: {layout_counts[LayoutType.SINGLE]}, spread: {layout_counts[LayoutType.SPREAD]})"
@@ -319,6 +414,59 @@ def generate_pdf(html_path: Path, pdf_path: Path) -> None:
     print(f"Generated: {pdf_path}")
 
 
+def _era_worker(job: tuple[list[Show], Path, str, bool]) -> None:
+    """Render one era's HTML book in a worker process"""
+    shows, html_path, era, debug_layout = job
+    generate_book_prefiltered(shows, html_path, era=era, debug_layout=debug_layout)
+
+
+def render_eras_parallel(jobs: list[tuple[list[Show], Path, str, bool]]) -> None:
+    """
+    Render several era books in parallel.
+
+    HTML rendering is CPU-bound pure-Python string building with no shared
+    state between eras, so each era's (already-sliced) shows go to a worker
+    process. The slices pickle cheaply since Show/Set are plain dataclasses.
+    """
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_era_worker, jobs))
+
+
+def _pdf_worker(paths: tuple[Path, Path]) -> None:
+    """Render one PDF in a worker process"""
+    generate_pdf(*paths)
+
+
+def generate_pdfs_parallel(jobs: list[tuple[Path, Path]]) -> None:
+    """
+    Convert several HTML files to PDFs in parallel.
+
+    Weasyprint layout is CPU-bound, so the per-era jobs go to a process
+    pool rather than threads.
+    """
+    workers = min(len(jobs), os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        list(ex.map(_pdf_worker, jobs))
+
+
+def _load_shows_cached(data_path: Path, cache_dir: Path) -> list[Show]:
+    """
+    Load shows, reusing a pickled parse from a previous run when the data
+    file hasn't changed.
+
+    preview.py re-invokes generate.py on every watched-file edit, so the
+    data would otherwise be reparsed even when only the stylesheet changed.
+    The cache is keyed by the data file's mtime and size; a stale or
+    unreadable cache just falls back to parsing.
+    """
+    key = (data_path.stat().st_mtime_ns, data_path.stat().st_size)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return load_or_build_snapshot(
+        cache_dir / ".shows.pkl", key, lambda: get_all_shows(data_path)
+    )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Generate Grateful Dead setlist books",
@@ -387,16 +535,16 @@ Examples:
         print(f"Error: Data file not found: {data_path}")
         return
 
-    # Parse all shows
-    print(f"Loading shows from {data_path}...")
-    shows = get_all_shows(data_path)
-    print(f"Loaded {len(shows)} shows")
-
     # Output directory
     output_dir = args.output
     if not output_dir.is_absolute():
         output_dir = script_dir / output_dir
 
+    # Parse all shows (or reuse the cached parse if the data is unchanged)
+    print(f"Loading shows from {data_path}...")
+    shows = _load_shows_cached(data_path, output_dir)
+    print(f"Loaded {len(shows)} shows")
+
     # Generate based on mode
     if args.era:
         filename = f"gd-{args.era}"
@@ -413,18 +561,28 @@ Examples:
             pdf_path = output_dir / f"{filename}.pdf"
             generate_pdf(html_path, pdf_path)
     else:
+        # Sort once and slice each era out with bisect rather than
+        # re-scanning the full show list 14 times
+        shows.sort(key=lambda s: s.ymd)
+        ymds = [s.ymd for s in shows]
+
+        render_jobs = []
+        pdf_jobs = []
         for era in [str(i) for i in range(1, 15)]:
+            start_tup, end_tup, _, _ = get_era_dates(era)
+            lo = bisect.bisect_left(ymds, start_tup)
+            hi = bisect.bisect_right(ymds, end_tup)
+
             html_path = output_dir / f"gd-{era}.html"
-            generate_book(
-                shows,
-                html_path,
-                era=era,
-                debug_layout=args.debug_layout,
-            )
+            render_jobs.append((shows[lo:hi], html_path, era, args.debug_layout))
 
             if args.pdf:
-                pdf_path = output_dir / f"gd-{era}.pdf"
-                generate_pdf(html_path, pdf_path)
+                pdf_jobs.append((html_path, output_dir / f"gd-{era}.pdf"))
+
+        render_eras_parallel(render_jobs)
+
+        if pdf_jobs:
+            generate_pdfs_parallel(pdf_jobs)
 
     if not args.pdf:
         print("\nTo preview, open the HTML file in your browser")
@@ -1,74 +1,193 @@
+import csv
+import functools
+import hashlib
 import json
+import mmap
+import pickle
+import re
+import sys
+from collections import defaultdict
 from pathlib import Path
+from typing import Iterable
 
 from classes import Set, Show
 
-
-def shows_from_lines(data: list[list[str]]) -> dict[str, list[Show]]:
+# Precompiled prefix classifiers: one DFA scan replaces the
+# startswith-then-partition pair on qualifying rows
+_ANNOTATION_RE = re.compile(r"^\((electric|acoustic)\) ")
+_FURTHER_ID_RE = re.compile(r"^\((early|late)\)")
+
+
+def read_tsv_rows(path: Path):
+    """
+    Yield TSV rows from a memory-mapped file, splitting on raw bytes.
+
+    The setlist data has no embedded tabs, so splitting each line on
+    b'\\t' and decoding the cells avoids both the csv module's
+    per-character state machine and the text layer's incremental
+    decoding; any line that does contain a quote falls back to
+    csv.reader for safety. Rows are yielded as they're read so the
+    whole file is never held as a row list.
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            for line in iter(mm.readline, b""):
+                line = line.rstrip(b"\r\n")
+                if b'"' in line:
+                    decoded = line.decode("utf-8")
+                    yield next(csv.reader([decoded], delimiter="\t", quotechar='"'))
+                else:
+                    yield [cell.decode("utf-8") for cell in line.split(b"\t")]
+        finally:
+            mm.close()
+
+
+def load_or_build_snapshot(cache_path: Path, key, build):
+    """
+    Return the value pickled at cache_path if it was written under the same
+    key; otherwise call build(), snapshot (key, value) with protocol 5, and
+    return the fresh value. Any failure to read or unpickle — a truncated
+    write, or a snapshot from an older class layout — just means we
+    rebuild.
+    """
+    try:
+        with cache_path.open("rb") as f:
+            cached_key, value = pickle.load(f)
+        if cached_key == key:
+            return value
+    except Exception:
+        pass
+
+    value = build()
+    with cache_path.open("wb") as f:
+        pickle.dump((key, value), f, protocol=5)
+    return value
+
+
+@functools.cache
+def _load_shows(path: Path) -> tuple[list[Show], dict[str, list[Show]]]:
+    """
+    Parse the TSV into the flat show list and its date index, snapshotting
+    both as a pickle next to the data file. While the TSV's contents are
+    unchanged, later calls skip the parse and just unpickle. Memoized per
+    path, so within one process even the unpickle happens only once.
+
+    The key is a content hash rather than mtime, so a touch or re-download
+    of identical data doesn't invalidate the snapshot; hashing the file is
+    orders of magnitude cheaper than parsing it.
+    """
+    key = hashlib.blake2b(path.read_bytes(), digest_size=16).hexdigest()
+    return load_or_build_snapshot(
+        path.parent / f".{path.stem}.cache.pkl",
+        key,
+        lambda: _shows_and_index(read_tsv_rows(path)),
+    )
+
+
+def get_all_shows_from_tsv(path: Path) -> list[Show]:
+    """Read shows from the raw TSV export"""
+    return _load_shows(path)[0]
+
+
+def get_by_date(path: Path, date: str) -> list[Show]:
+    """
+    Return the shows played on a date (e.g. "1977/5/8"), possibly several
+    for early/late billings. Nothing is parsed until the first query; the
+    memoized loader makes repeated queries a plain dict lookup.
+    """
+    return _load_shows(path)[1].get(date, [])
+
+
+def shows_from_lines(data: Iterable[list[str]]) -> dict[str, list[Show]]:
+    return _shows_and_index(data)[1]
+
+
+def _shows_and_index(
+    data: Iterable[list[str]],
+) -> tuple[list[Show], dict[str, list[Show]]]:
+    """Parse rows into the flat show list plus its by-date index.
+
+    Both views share the same Show objects, so callers that want the full
+    list don't have to re-flatten the index afterwards.
+    """
     shows = []
     current_show = None
 
     for row in data:
-        if len(row) == -1:
-            continue
-
-        if row[2] == "" and current_show is not None:
-            [possible_set_label, song, *_rest] = row
+        # Short rows aren't padded out to seven columns; index with length
+        # guards instead of allocating a padded copy per row
+        n = len(row)
+        is_set_row = n <= 2 or row[2] == ""
+
+        if is_set_row and current_show is not None:
+            possible_set_label = row[0] if n > 0 else ""
+            song = row[1] if n > 1 else ""
             if possible_set_label != "" or len(current_show.sets) == 0:
-                s = Set()
-                s.label = possible_set_label[:-1] if possible_set_label else "I"
-                if song.startswith("(electric)") or song.startswith("(acoustic)"):
-                    paren_idx = song.index(")")
-                    s.annotation = song[1:paren_idx]
-                    song = song[paren_idx + 2 :]
-                s.songs = [song]
-
-                current_show.sets.append(s)
+                annotation = None
+                # Gated by a cheap first-character check since most songs
+                # carry no prefix
+                if song[:1] == "(":
+                    m = _ANNOTATION_RE.match(song)
+                    if m:
+                        annotation = m.group(1)
+                        song = song[m.end() :]
+
+                current_show.sets.append(
+                    Set(
+                        label=sys.intern(
+                            possible_set_label[:-1] if possible_set_label else "I"
+                        ),
+                        annotation=annotation,
+                        songs=[sys.intern(song)],
+                    )
+                )
             else:
-                current_show.sets[len(current_show.sets) - 1].songs.append(song)
+                current_show.sets[-1].songs.append(sys.intern(song))
 
             continue
-        elif row[2] == "":
+        elif is_set_row:
             continue
 
         # new show
-        if current_show is not None:
-            if len(current_show) > 0:
-                shows.append(current_show)
-            current_show = None
-
-        [date_or_set, _band, venue1, venue2, city, state_or_country, notes] = row
-
-        current_show = Show()
-        current_show.date = date_or_set
-        current_show.venue1 = venue1
-        current_show.venue2 = venue2
-        current_show.city = city
-        current_show.state_or_country = state_or_country
+        if current_show is not None and len(current_show) > 0:
+            shows.append(current_show)
 
-        if notes.startswith("(early)") or notes.startswith("(late)"):
-            current_show.further_id = notes[: notes.index(")") + 1]
-            notes = notes[notes.index(")") + 1 :]
+        further_id = ""
+        notes = row[6] if n > 6 else ""
+        if notes[:1] == "(":
+            m = _FURTHER_ID_RE.match(notes)
+            if m:
+                further_id = m.group(0)
+                notes = notes[m.end() :]
 
         notes = notes.strip().strip("()")
         if len(notes) > 0 and notes[0].islower() and not notes.startswith("w/"):
             notes = notes[0].upper() + notes[1:]
 
-        current_show.notes = notes
-        current_show.sets = []
+        # One constructor call instead of seven STORE_ATTR dispatches;
+        # interning collapses the many repeated venues/cities/states to one
+        # shared object apiece
+        current_show = Show(
+            date=row[0],
+            further_id=further_id,
+            venue1=sys.intern(row[2]),
+            venue2=sys.intern(row[3]) if n > 3 else "",
+            city=sys.intern(row[4]) if n > 4 else "",
+            state_or_country=sys.intern(row[5]) if n > 5 else "",
+            notes=notes,
+            sets=[],
+        )
 
     if current_show is not None:
         shows.append(current_show)
         current_show = None
 
-    ret = {}
+    ret = defaultdict(list)
     for s in shows:
-        if s.date in ret:
-            ret[s.date].append(s)
-        else:
-            ret[s.date] = [s]
+        ret[s.date].append(s)
 
-    return ret
+    return shows, dict(ret)
 
 
 def get_all_shows(path: Path) -> list[Show]:
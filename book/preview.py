@@ -24,6 +24,14 @@ import time
 from functools import partial
 from pathlib import Path
 
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    # watchdog is optional; we fall back to the polling loop without it
+    FileSystemEventHandler = object
+    Observer = None
+
 
 class PreviewHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler with better defaults for our use case"""
@@ -56,8 +64,53 @@ def regenerate(args, script_dir: Path):
     subprocess.run(cmd, cwd=script_dir)
 
 
+class RegenerateHandler(FileSystemEventHandler):
+    """Regenerate on watched-file changes, with a short debounce since
+    editors often fire several events per save"""
+
+    def __init__(self, args, script_dir: Path, watched_files: list[Path]):
+        self.args = args
+        self.script_dir = script_dir
+        self.watched = {str(f) for f in watched_files}
+        self.last_run = 0.0
+
+    def on_modified(self, event):
+        if event.src_path not in self.watched:
+            return
+        now = time.monotonic()
+        if now - self.last_run < 0.2:
+            return
+        self.last_run = now
+
+        print(f"\nFile changed: {Path(event.src_path).name}")
+        regenerate(self.args, self.script_dir)
+        print("\n✓ Regenerated. Refresh your browser to see changes.\n")
+
+
+def start_watcher(args, script_dir: Path, watched_files: list[Path]):
+    """
+    Start watching the given files, preferring kernel-level events
+    (inotify/FSEvents via watchdog) over the 1-second polling loop.
+    """
+    if Observer is not None:
+        handler = RegenerateHandler(args, script_dir, watched_files)
+        observer = Observer()
+        for directory in {str(f.parent) for f in watched_files}:
+            observer.schedule(handler, directory)
+        observer.start()
+        return
+
+    # Fallback: poll mtimes once a second
+    watcher_thread = threading.Thread(
+        target=watch_for_changes,
+        args=(args, script_dir, watched_files),
+        daemon=True,
+    )
+    watcher_thread.start()
+
+
 def watch_for_changes(args, script_dir: Path, watched_files: list[Path]):
-    """Watch files for changes and regenerate"""
+    """Watch files for changes by polling mtimes and regenerate"""
     mtimes = {f: f.stat().st_mtime if f.exists() else 0 for f in watched_files}
 
     while True:
@@ -128,12 +181,7 @@ def main():
             script_dir.parent / "data" / "setlist.jsonl",
             script_dir / "parse_shows.py",
         ]
-        watcher_thread = threading.Thread(
-            target=watch_for_changes,
-            args=(args, script_dir, watched_files),
-            daemon=True,
-        )
-        watcher_thread.start()
+        start_watcher(args, script_dir, watched_files)
         print("Watching for changes to style.css, generate.py, and setlist.jsonl")
 
     # Start server
@@ -0,0 +1,160 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+from book.classes import Set, Show
+
+# parse_shows imports its siblings flat (from classes import ...), so make
+# the book directory importable when the suite runs from the repo root
+_BOOK_DIR = str(Path(__file__).resolve().parent.parent)
+if _BOOK_DIR not in sys.path:
+    sys.path.insert(0, _BOOK_DIR)
+
+
+def _show_1993_05_27() -> Show:
+    set1 = Set(
+        label="1",
+        songs=[
+            "Shakedown Street",
+            "The Same Thing",
+            "Dire Wolf",
+            "Beat It On Down The Line",
+            "High Time",
+            "When I Paint My Masterpiece",
+            "Cumberland Blues",
+            "Promised Land",
+        ],
+    )
+
+    set2 = Set(
+        label="2",
+        songs=[
+            "Picasso Moon",
+            "> Fire On The Mountain",
+            "> Wave To The Wind",
+            "Cassidy",
+            "> Uncle John's Band",
+            "> Cassidy",
+            "> Drums",
+            "> Space",
+            "> The Other One",
+            "> Wharf Rat",
+            "> Sugar Magnolia",
+        ],
+    )
+
+    encore = Set(label="E", songs=["Gloria"])
+
+    return Show(
+        date="1993/5/27",
+        venue1="Cal Expo Amphitheatre",
+        city="Sacramento",
+        state_or_country="CA",
+        notes="Rex Foundation benefit; portions released as Road Trips v. 2 no. 4",
+        sets=[set1, set2, encore],
+    )
+
+
+def _show_1976_10_10() -> Show:
+    set1 = Set(
+        label="I",
+        songs=[
+            "Might As Well",
+            "Mama Tried",
+            "Ramble On Rose",
+            "Cassidy",
+            "Deal",
+            "El Paso",
+            "Loser",
+            "Promised Land",
+            "Friend Of The Devil",
+            "Dancin' In The Streets",
+            "> Wharf Rat",
+            "> Dancin' In The Streets",
+        ],
+    )
+    set2 = Set(
+        label="II",
+        songs=[
+            "Samson & Delilah",
+            "Brown-Eyed Women",
+            "Playin' In The Band",
+            "> Drums",
+            "> The Wheel",
+            "> Jam",
+            "> The Other One",
+            "> Stella Blue",
+            "> Playin' Reprise",
+            "> Sugar Magnolia",
+        ],
+    )
+
+    encore = Set(label="E", songs=["Johnny B. Goode"])
+
+    return Show(
+        date="1976/10/10",
+        venue1="Oakland Coliseum Stadium",
+        city="Oakland",
+        state_or_country="CA",
+        notes="Opened for The Who; released as Dick's Picks v. 33",
+        sets=[set1, set2, encore],
+    )
+
+
+def _show_1970_05_14() -> Show:
+    return Show(
+        date="1970/05/14",
+        venue1="Merramec Community College",
+        city="Kirkwood",
+        state_or_country="MO",
+        notes="*w/John Dawson & David Nelson; first Attics Of My Life, Nobody's Jam; portions released as Road Trips v. 3 no. 3",
+        sets=[
+            Set(
+                label="I",
+                annotation="acoustic",
+                songs=[
+                    "Don't Ease Me In",
+                    "Friend Of The Devil",
+                    "Deep Elem Blues",
+                    "Silver Threads & Golden Needles",
+                    "Candyman",
+                ],
+            ),
+            Set(
+                label="II",
+                annotation="electric",
+                songs=[
+                    "Casey Jones",
+                    "China Cat Sunflower",
+                    "> I Know You Rider",
+                    "Mama Tried",
+                    "> High Time",
+                    "Good Lovin'",
+                    "Good Morning Little Schoolgirl",
+                    "Me & My Uncle",
+                    "Dire Wolf",
+                    "Cold Rain & Snow",
+                    "Attics Of My Life",
+                    "Cumberland Blues",
+                    "New Speedway Boogie",
+                    "> Nobody's Jam",
+                    "> New Speedway Boogie",
+                    "> St. Stephen",
+                    "> Not Fade Away",
+                    "> Turn On Your Lovelight",
+                ],
+            ),
+            Set(label="E", annotation=None, songs=["Cold Jordan*"]),
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def shows() -> dict[str, Show]:
+    """Canned shows, built once for the whole test session"""
+    return {
+        "1993/5/27": _show_1993_05_27(),
+        "1976/10/10": _show_1976_10_10(),
+        "1970/05/14": _show_1970_05_14(),
+    }
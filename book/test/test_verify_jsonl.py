@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+import parse_shows
+
+_DATA_DIR = Path(__file__).resolve().parents[2] / "data"
+_TSV_PATH = _DATA_DIR / "setlist.tsv"
+_JSONL_PATH = _DATA_DIR / "setlist.jsonl"
+
+pytestmark = pytest.mark.skipif(
+    not _TSV_PATH.exists(), reason="raw TSV export not present"
+)
+
+
+@pytest.fixture(scope="session")
+def tsv_shows():
+    return parse_shows.get_all_shows_from_tsv(_TSV_PATH)
+
+
+@pytest.fixture(scope="session")
+def jsonl_shows():
+    return parse_shows.get_all_shows(_JSONL_PATH)
+
+
+def test_show_counts_match(tsv_shows, jsonl_shows):
+    assert len(tsv_shows) == len(jsonl_shows)
+
+
+@pytest.mark.parametrize("i", range(5))
+def test_show_structure_matches(tsv_shows, jsonl_shows, i):
+    tsv, jsonl = tsv_shows[i], jsonl_shows[i]
+    assert tsv.date == jsonl.date
+    assert len(tsv.sets) == len(jsonl.sets)
+    for tsv_set, jsonl_set in zip(tsv.sets, jsonl.sets):
+        assert len(tsv_set.songs) == len(jsonl_set.songs)
@@ -1,19 +1,37 @@
 #!/usr/bin/env python3
 """Verify that JSONL reading produces the same results as TSV reading"""
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from parse_shows import get_all_shows, get_all_shows_from_tsv
 
+
+def _mismatches(tsv_shows, jsonl_shows):
+    """Lazily yield a message per structural mismatch in the first five shows"""
+    for i, (tsv, jsonl) in enumerate(zip(tsv_shows[:5], jsonl_shows[:5])):
+        if tsv.date != jsonl.date:
+            yield f"Show {i} dates don't match! TSV: {tsv.date}, JSONL: {jsonl.date}"
+        elif len(tsv.sets) != len(jsonl.sets):
+            yield f"Show {i} ({tsv.date}) has different number of sets! TSV: {len(tsv.sets)}, JSONL: {len(jsonl.sets)}"
+        else:
+            for j, (tsv_set, jsonl_set) in enumerate(zip(tsv.sets, jsonl.sets)):
+                if len(tsv_set.songs) != len(jsonl_set.songs):
+                    yield f"Show {i} ({tsv.date}) set {j} has different number of songs! TSV: {len(tsv_set.songs)}, JSONL: {len(jsonl_set.songs)}"
+
+
 def main():
     tsv_path = Path("../data/setlist.tsv")
     jsonl_path = Path("../data/setlist.jsonl")
 
-    print("Reading from TSV...")
-    tsv_shows = get_all_shows_from_tsv(tsv_path)
+    # The two parses are independent CPU-bound work, so overlap them in
+    # worker processes
+    print("Reading from TSV and JSONL...")
+    with ProcessPoolExecutor(max_workers=2) as ex:
+        tsv_future = ex.submit(get_all_shows_from_tsv, tsv_path)
+        jsonl_future = ex.submit(get_all_shows, jsonl_path)
+        tsv_shows = tsv_future.result()
+        jsonl_shows = jsonl_future.result()
     print(f"Loaded {len(tsv_shows)} shows from TSV")
-
-    print("Reading from JSONL...")
-    jsonl_shows = get_all_shows(jsonl_path)
     print(f"Loaded {len(jsonl_shows)} shows from JSONL")
 
     # Compare counts
@@ -21,23 +39,12 @@ def main():
         print(f"ERROR: Different number of shows! TSV: {len(tsv_shows)}, JSONL: {len(jsonl_shows)}")
         return False
 
-    # Compare first few shows
-    for i in range(min(5, len(tsv_shows))):
-        tsv = tsv_shows[i]
-        jsonl = jsonl_shows[i]
-
-        if tsv.date != jsonl.date:
-            print(f"ERROR: Show {i} dates don't match! TSV: {tsv.date}, JSONL: {jsonl.date}")
-            return False
-
-        if len(tsv.sets) != len(jsonl.sets):
-            print(f"ERROR: Show {i} ({tsv.date}) has different number of sets! TSV: {len(tsv.sets)}, JSONL: {len(jsonl.sets)}")
-            return False
-
-        for j, (tsv_set, jsonl_set) in enumerate(zip(tsv.sets, jsonl.sets)):
-            if len(tsv_set.songs) != len(jsonl_set.songs):
-                print(f"ERROR: Show {i} ({tsv.date}) set {j} has different number of songs! TSV: {len(tsv_set.songs)}, JSONL: {len(jsonl_set.songs)}")
-                return False
+    # Compare first few shows, stopping at the first mismatch; the
+    # generator is lazy so nothing past the failure is even examined
+    error = next(_mismatches(tsv_shows, jsonl_shows), None)
+    if error is not None:
+        print(f"ERROR: {error}")
+        return False
 
     print("\n✓ Verification successful! JSONL matches TSV data")
     print(f"  - {len(jsonl_shows)} shows")